@@ -1,30 +1,41 @@
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+from er_dataset import read_master
+
+def partial_quantiles(values, qs):
+    # Same linear interpolation as Series.quantile, but np.partition only
+    # puts the few ranks we need in place instead of sorting everything
+    if values.size == 0:
+        return np.full(len(qs), np.nan)
+    positions = np.asarray(qs) * (len(values) - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.ceil(positions).astype(int)
+    part = np.partition(values, np.union1d(lower, upper))
+    return part[lower] + (part[upper] - part[lower]) * (positions - lower)
 
 def analyze_distribution(file_path, hospital_name="ROYAL VICTORIA"):
     print(f"--- ANALYZING DISTRIBUTION FOR: {hospital_name} ---")
     
     # 1. Load & Clean
-    df = pd.read_csv(file_path)
+    df = read_master(file_path)
     
     # Filter for the specific hospital
     # We use 'contains' to be safe with naming variations
-    target_df = df[df['Nom_installation'].str.contains(hospital_name, case=False, na=False)].copy()
+    # (checked once per distinct installation name, not once per row)
+    names = df['Nom_installation'].cat.categories
+    matching_names = names[names.str.contains(hospital_name, case=False)]
+    target_df = df[df['Nom_installation'].isin(matching_names)].copy()
     
     if target_df.empty:
         print(f"ERROR: No data found for {hospital_name}.")
         return
 
-    # Convert DMS to numeric (coercing errors to NaN)
-    target_df['DMS_ambulatoire'] = pd.to_numeric(target_df['DMS_ambulatoire'], errors='coerce')
     clean_data = target_df.dropna(subset=['DMS_ambulatoire'])
+    values = clean_data['DMS_ambulatoire'].to_numpy()
     
     # 2. Calculate Statistics
     # We use the 33rd and 66th percentiles to define our 3 classes
-    percentiles = clean_data['DMS_ambulatoire'].quantile([0.33, 0.66]).values
-    t_short = percentiles[0]
-    t_long = percentiles[1]
+    t_short, t_long = partial_quantiles(values, [0.33, 0.66])
     
     mean_val = clean_data['DMS_ambulatoire'].mean()
     max_val = clean_data['DMS_ambulatoire'].max()
@@ -39,8 +50,10 @@ def analyze_distribution(file_path, hospital_name="ROYAL VICTORIA"):
     print("-" * 30)
 
     # 3. Visualization
+    # Bin once with numpy and draw the counts directly
+    counts, edges = np.histogram(values, bins=30)
     plt.figure(figsize=(10, 6))
-    sns.histplot(clean_data['DMS_ambulatoire'], bins=30, kde=True, color='skyblue')
+    plt.stairs(counts, edges, fill=True, color='skyblue')
     plt.axvline(t_short, color='green', linestyle='--', label=f'Short/Std Cutoff ({t_short:.1f}h)')
     plt.axvline(t_long, color='red', linestyle='--', label=f'Std/Long Cutoff ({t_long:.1f}h)')
     plt.title(f'Distribution of ER Service Times ({hospital_name})')
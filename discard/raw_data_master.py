@@ -1,5 +1,6 @@
 import pandas as pd
 import glob
+import io
 import os
 
 def compile_er_data(source_folder='raw_data', output_file='master_dataset.csv'):
@@ -11,32 +12,53 @@ def compile_er_data(source_folder='raw_data', output_file='master_dataset.csv'):
     files_processed = 0
     files_skipped = 0
 
-    # 2. Loop through each file
+    # 2. Group the files by header line
+    # Every scrape of the feed shares the same header, so instead of calling
+    # read_csv once per file we glue the bodies together and parse each group
+    # in a single pass.
+    batches = {}
     for filename in files:
         try:
-            # Read the CSV file
-            # on_bad_lines='skip' helps skip broken lines in corrupted files
-            df = pd.read_csv(filename, on_bad_lines='skip')
+            with open(filename, 'rb') as f:
+                header = f.readline()
+                body = f.read()
+        except OSError as e:
+            print(f"Error reading {filename}: {e}")
+            files_skipped += 1
+            continue
 
-            # Check if file is empty or missing critical columns
-            if df.empty:
-                files_skipped += 1
-                continue
-            
-            # Optional: Check for a critical column to ensure it's a valid ER file
-            # Adjust 'Mise_a_jour' if your files have different headers
-            if 'Mise_a_jour' not in df.columns:
-                files_skipped += 1
-                continue
+        # Header-only files have no rows to contribute
+        if not body.strip():
+            files_skipped += 1
+            continue
 
-            # Append to our list
-            all_data.append(df)
-            files_processed += 1
+        if not body.endswith(b'\n'):
+            body += b'\n'
+        batches.setdefault(header, []).append((filename, body))
 
-        except Exception as e:
-            # Handle completely unusable/corrupt files
-            print(f"Error reading {filename}: {e}")
-            files_skipped += 1
+    # 3. Parse each group
+    for header, members in batches.items():
+        # Optional: Check for a critical column to ensure it's a valid ER file
+        # Adjust 'Mise_a_jour' if your files have different headers
+        if b'Mise_a_jour' not in header:
+            files_skipped += len(members)
+            continue
+
+        try:
+            # on_bad_lines='skip' helps skip broken lines in corrupted files
+            df = pd.read_csv(io.BytesIO(header + b''.join(body for _, body in members)), on_bad_lines='skip')
+            all_data.append(df)
+            files_processed += len(members)
+        except Exception:
+            # One unusable file spoils the whole group, so retry file by file
+            for filename, body in members:
+                try:
+                    all_data.append(pd.read_csv(io.BytesIO(header + body), on_bad_lines='skip'))
+                    files_processed += 1
+                except Exception as e:
+                    # Handle completely unusable/corrupt files
+                    print(f"Error reading {filename}: {e}")
+                    files_skipped += 1
 
     if not all_data:
         print("No valid data found. Check your folder path.")
@@ -44,23 +66,23 @@ def compile_er_data(source_folder='raw_data', output_file='master_dataset.csv'):
 
     print(f"Concatenating {files_processed} valid files...")
     
-    # 3. Combine all dataframes into one
+    # 4. Combine all dataframes into one
     master_df = pd.concat(all_data, ignore_index=True)
 
-    # 4. Remove Duplicates
+    # 5. Remove Duplicates
     # Since the scraper runs every 10 mins but data updates hourly, 
     # many rows will be identical. dropping duplicates removes these redundant snapshots.
     initial_rows = len(master_df)
-    master_df.drop_duplicates(inplace=True)
+    master_df.drop_duplicates(ignore_index=True, inplace=True)
     final_rows = len(master_df)
 
-    # 5. Sort by time
+    # 6. Sort by time
     # Convert 'Mise_a_jour' to datetime for sorting (and for your analysis)
     if 'Mise_a_jour' in master_df.columns:
         master_df['Mise_a_jour'] = pd.to_datetime(master_df['Mise_a_jour'], errors='coerce')
         master_df.sort_values(by=['Mise_a_jour', 'Nom_etablissement'], inplace=True)
 
-    # 6. Save the result
+    # 7. Save the result
     master_df.to_csv(output_file, index=False)
     
     print("-" * 30)
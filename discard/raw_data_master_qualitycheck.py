@@ -1,11 +1,12 @@
 import pandas as pd
+import numpy as np
 
 def check_master_dataset(file_path='master_dataset.csv'):
     print(f"Loading {file_path}...\n")
     
     try:
-        # Load the dataset
-        df = pd.read_csv(file_path)
+        # Load the dataset (only the columns this report looks at)
+        df = pd.read_csv(file_path, usecols=lambda col: col in ('Mise_a_jour', 'Nom_etablissement', 'Region'))
         
         # Check if the critical date column exists
         if 'Mise_a_jour' not in df.columns:
@@ -13,7 +14,8 @@ def check_master_dataset(file_path='master_dataset.csv'):
             return
 
         # Convert to datetime objects
-        df['Timestamp'] = pd.to_datetime(df['Mise_a_jour'])
+        # (raw_data_master.py writes ISO dates, so skip the per-row format guessing)
+        df['Timestamp'] = pd.to_datetime(df['Mise_a_jour'], format='ISO8601')
         
         # --- 1. DATE RANGE ---
         min_date = df['Timestamp'].min()
@@ -44,12 +46,14 @@ def check_master_dataset(file_path='master_dataset.csv'):
 
         # --- 3. HOURLY DISTRIBUTION ---
         # This answers: "Do we have data for 3 AM as often as 3 PM?"
-        df['Hour'] = df['Timestamp'].dt.hour
-        df['Date_Str'] = df['Timestamp'].dt.date.astype(str)
+        # Whole hours since 1970: hour of day is % 24 and the day is // 24,
+        # so each distinct value is one (day, hour) slot with data.
+        hours = df['Timestamp'].to_numpy(dtype='datetime64[h]')
+        slots = np.unique(hours[~np.isnat(hours)].astype(np.int64))
         
         # We count how many unique DAYS appear for each HOUR.
         # e.g., If we have 10 days of data, we expect '10' for every hour.
-        hourly_coverage = df.groupby('Hour')['Date_Str'].nunique()
+        hourly_coverage = np.bincount(slots % 24, minlength=24)
 
         print("-" * 40)
         print(f"3. HOURLY COVERAGE (Count of Days with Data per Hour)")
@@ -60,7 +64,7 @@ def check_master_dataset(file_path='master_dataset.csv'):
         max_days = hourly_coverage.max()
         
         for hour in range(24):
-            count = hourly_coverage.get(hour, 0)
+            count = hourly_coverage[hour]
             # Visual indicator of missingness
             if count == 0:
                 status = "MISSING ALL DATA" 
@@ -1,13 +1,12 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from simulation_engine import run_experiment, calibrate_royal_victoria, Patient, ER_Simulation, patient_generator
 import simpy
 
 # --- SETUP ---
 # We need a custom runner to capture the raw data for graphing
-def run_and_capture(file_path, policy_name, days=7):
-    capacity, avg_los, arrival_rate = calibrate_royal_victoria(file_path)
+def run_and_capture(capacity, avg_los, arrival_rate, policy_name, days=7):
     env = simpy.Environment()
     er = ER_Simulation(env, num_beds=capacity, service_rate_mean=avg_los, policy_name=policy_name)
     env.process(patient_generator(env, er, arrival_rate))
@@ -17,20 +16,30 @@ def run_and_capture(file_path, policy_name, days=7):
 # --- EXECUTION ---
 file_name = 'Quebec_ER_Master_Dataset.csv'
 
+# Both policies run on the same hospital, so read and calibrate it once
+capacity, avg_los, arrival_rate = calibrate_royal_victoria(file_name)
+
 print("Running Policy A: First Come First Served (Baseline)...")
-waits_fcfs = run_and_capture(file_name, "FCFS")
+waits_fcfs = run_and_capture(capacity, avg_los, arrival_rate, "FCFS")
 
 print("Running Policy B: The Guillotine (>24h Priority)...")
-waits_guillotine = run_and_capture(file_name, "Guillotine_24h")
+waits_guillotine = run_and_capture(capacity, avg_los, arrival_rate, "Guillotine_24h")
 
 # --- VISUALIZATION (THE WINNING GRAPH) ---
+# Both histograms use 5h bins, so build the edges once and bin with numpy
+waits_fcfs = np.asarray(waits_fcfs)
+waits_guillotine = np.asarray(waits_guillotine)
+edges = np.arange(0, max(waits_fcfs.max(), waits_guillotine.max()) + 5, 5)
+counts_fcfs, _ = np.histogram(waits_fcfs, bins=edges)
+counts_guillotine, _ = np.histogram(waits_guillotine, bins=edges)
+
 plt.figure(figsize=(12, 6))
 
 # Histogram A (Control)
-sns.histplot(waits_fcfs, color="red", alpha=0.5, label="FCFS (Current System)", kde=True, binwidth=5)
+plt.stairs(counts_fcfs, edges, fill=True, color="red", alpha=0.5, label="FCFS (Current System)")
 
 # Histogram B (Experiment)
-sns.histplot(waits_guillotine, color="blue", alpha=0.5, label="Guillotine Protocol (>24h Priority)", kde=True, binwidth=5)
+plt.stairs(counts_guillotine, edges, fill=True, color="blue", alpha=0.5, label="Guillotine Protocol (>24h Priority)")
 
 # The "Crisis Line"
 plt.axvline(24, color='black', linestyle='--', linewidth=2, label="24h Target Limit")
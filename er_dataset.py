@@ -0,0 +1,86 @@
+import pandas as pd
+
+# --- MASTER DATASET SCHEMA ---
+# The only columns the analysis scripts read from the master dataset.
+# Everything else in the file is skipped by the parser.
+ER_COLS = [
+    'Nom_installation',
+    'Nom_etablissement',
+    'Region',
+    'Timestamp',
+    'Nombre_de_civieres_fonctionnelles',
+    'Nombre_de_civieres_occupees',
+    'DMS_ambulatoire',
+    'DMS_sur_civiere',
+]
+
+# Lengths of stay fit easily in float32. The stretcher counts stay float64:
+# the occupancy rate is computed from them and float32 rounding would push
+# rates sitting exactly on a bin edge (60%, 80%, 100%...) into the next bin.
+ER_DTYPES = {
+    'Nom_installation': 'category',
+    'Nombre_de_civieres_fonctionnelles': 'float64',
+    'Nombre_de_civieres_occupees': 'float64',
+    'DMS_ambulatoire': 'float32',
+    'DMS_sur_civiere': 'float32',
+}
+
+# What the feed writes instead of leaving a cell empty
+ER_NA_VALUES = ["pas d'information disponible"]
+
+# The committed Quebec_ER_Master_Dataset.csv stores Timestamp in this one
+# fixed format, so the CSV reader can be told the format instead of guessing it
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Per-region summary rows; most analyses drop them to avoid double counting
+REGIONAL_TOTAL = 'Total régional'
+
+# Rows per chunk when filtering the CSV while reading it
+CSV_CHUNK_ROWS = 500_000
+
+
+def read_master(file_path='Quebec_ER_Master_Dataset.csv', columns=ER_COLS, drop_regional_totals=False):
+    # The reader follows the extension of the path given: pass the .parquet
+    # written by master_dataset.py to read it, otherwise the CSV is parsed
+    if file_path.endswith('.parquet'):
+        filters = None
+        if drop_regional_totals:
+            # Let pyarrow skip the rows while reading. Rows with no
+            # etablissement are kept, same as a pandas != comparison.
+            import pyarrow.dataset as ds
+            etablissement = ds.field('Nom_etablissement')
+            filters = (etablissement != REGIONAL_TOTAL) | etablissement.is_null()
+        return pd.read_parquet(file_path, columns=columns, filters=filters)
+
+    # Declaring the columns and their types up front lets the C parser skip
+    # the unused columns and the type-inference pass, so no more
+    # pd.to_numeric(..., errors='coerce') clean-up afterwards
+    csv_options = dict(
+        usecols=columns,
+        dtype=ER_DTYPES,
+        na_values=ER_NA_VALUES,
+        engine='c',
+    )
+    if not drop_regional_totals:
+        df = pd.read_csv(file_path, **csv_options)
+    else:
+        # Filter chunk by chunk so the full file is never in memory at once
+        chunks = pd.read_csv(file_path, chunksize=CSV_CHUNK_ROWS, **csv_options)
+        df = pd.concat(chunk[chunk['Nom_etablissement'] != REGIONAL_TOTAL] for chunk in chunks)
+
+        # Chunks each infer their own categories, so set the dtypes again
+        df = df.astype({col: dtype for col, dtype in ER_DTYPES.items() if col in df.columns})
+
+    if 'Timestamp' in columns:
+        df['Timestamp'] = parse_timestamps(df['Timestamp'])
+    return df
+
+
+def parse_timestamps(values):
+    # Fast path for the committed CSV's fixed format. A file written another
+    # way falls back to ISO 8601 (as the quality check does), and a value
+    # that is not a timestamp at all still raises instead of leaving text
+    try:
+        return pd.to_datetime(values, format=TIMESTAMP_FORMAT)
+    except ValueError:
+        return pd.to_datetime(values, format='ISO8601')
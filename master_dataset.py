@@ -1,4 +1,7 @@
 import pandas as pd
+import numpy as np
+import hashlib
+import io
 import os
 
 # --- CONFIGURATION ---
@@ -6,18 +9,32 @@ root_folder_path = 'raw_data'
 
 all_dataframes = []
 skipped_files = [] # To track files that failed to load
+duplicate_files = [] # Byte-identical copies of a file we already loaded
+loaded_digests = set()
 
 print(f"Scanning '{root_folder_path}' for data...")
 
 # 1. TRAVERSE FOLDERS
 for root, dirs, files in os.walk(root_folder_path):
-    for filename in files:
+    # Sorted so the earliest scrape of an identical dump is the one we keep
+    for filename in sorted(files):
         if filename.endswith(".csv"):
             file_path = os.path.join(root, filename)
             
             try:
                 # 2. READ THE FILE
-                current_df = pd.read_csv(file_path, encoding='utf-8')
+                with open(file_path, 'rb') as f:
+                    raw_bytes = f.read()
+
+                # The scraper runs more often than the data updates, so many
+                # files are exact copies of an earlier one. Skip those before
+                # paying for the CSV parse.
+                digest = hashlib.sha1(raw_bytes).digest()[:8]
+                if digest in loaded_digests:
+                    duplicate_files.append(filename)
+                    continue
+
+                current_df = pd.read_csv(io.BytesIO(raw_bytes), encoding='utf-8')
                 
                 # 3. STANDARDIZE TIMESTAMP
                 if 'Mise_a_jour' in current_df.columns:
@@ -32,6 +49,7 @@ for root, dirs, files in os.walk(root_folder_path):
                 current_df['Source_File'] = filename
                 
                 all_dataframes.append(current_df)
+                loaded_digests.add(digest)
                 
             except Exception as e:
                 # Log the file that failed and the error message
@@ -42,11 +60,46 @@ for root, dirs, files in os.walk(root_folder_path):
 if all_dataframes:
     print(f"\nMerging {len(all_dataframes)} successfully read files...")
     master_df = pd.concat(all_dataframes, ignore_index=True)
-    
+    # Drop the per-file frames now so they don't stay in memory next to
+    # the merged copy during the sort and the write
+    all_dataframes.clear()
+
     # 5. CLEANUP & SAVE
     master_df.sort_values(by=['Nom_installation', 'Timestamp'], inplace=True)
-    output_filename = 'Complete_Quebec_ER_Master_Dataset.csv'
-    master_df.to_csv(output_filename, index=False)
+
+    # Some dumps write "pas d'information disponible" in the numeric columns,
+    # which leaves them as a mix of numbers and text. Coerce them so they can
+    # be stored as real numeric columns.
+    numeric_cols = [
+        'Nombre_de_civieres_fonctionnelles',
+        'Nombre_de_civieres_occupees',
+        'Nombre_de_patients_sur_civiere_plus_de_24_heures',
+        'Nombre_de_patients_sur_civiere_plus_de_48_heures',
+        'Nombre_total_de_patients_presents_a_lurgence',
+        'Nombre_total_de_patients_en_attente_de_PEC',
+        'DMS_sur_civiere',
+        'DMS_ambulatoire',
+    ]
+    for col in numeric_cols:
+        master_df[col] = pd.to_numeric(master_df[col], errors='coerce')
+
+    # Lengths of stay are stored as float32 (half the size, plenty of
+    # precision for hours). The stretcher counts stay float64 because the
+    # occupancy rate is computed from them and has to land on exact bin edges.
+    for col in ['DMS_sur_civiere', 'DMS_ambulatoire']:
+        master_df[col] = master_df[col].astype('float32')
+
+    # Repeated names are stored once per distinct value
+    # (Region stays text so plots keep the order we sort them in)
+    for col in ['Nom_installation', 'Nom_etablissement']:
+        master_df[col] = master_df[col].astype('category')
+
+    # Parquet keeps the dtypes (Timestamp stays a datetime) and loads far
+    # faster than re-parsing a CSV. It keeps its own name so it never stands
+    # in for the curated Quebec_ER_Master_Dataset.csv: pass this path to
+    # read_master() explicitly to analyse the full rebuild instead
+    output_filename = 'Complete_Quebec_ER_Master_Dataset.parquet'
+    master_df.to_parquet(output_filename, compression='zstd', engine='pyarrow', index=False)
     
     # --- STATISTICS REPORT ---
     print("\n" + "="*40)
@@ -68,6 +121,7 @@ if all_dataframes:
 
     # C. SKIPPED FILES (WHAT DIDN'T COUNT)
     print("-" * 40)
+    print(f"Duplicate Files Skipped: {len(duplicate_files)}")
     print(f"Files Skipped/Failed: {len(skipped_files)}")
     if skipped_files:
         print("List of Failed Files:")
@@ -80,29 +134,30 @@ if all_dataframes:
     print("-" * 40)
     print("HOURLY COVERAGE ANALYSIS (Are we missing specific times?)")
     
-    master_df['Temp_Hour'] = master_df['Timestamp'].dt.hour
-    master_df['Temp_Date'] = master_df['Timestamp'].dt.date
+    # Whole hours since 1970 as plain integers: the day is // 24 and the
+    # hour of day is % 24, so no Python date objects are ever created.
+    # Each distinct value is one (day, hour) slot that has data.
+    hours = master_df['Timestamp'].to_numpy(dtype='datetime64[h]')
+    slots = np.unique(hours[~np.isnat(hours)].astype(np.int64))
     
-    total_unique_days = master_df['Temp_Date'].nunique()
+    total_unique_days = len(np.unique(slots // 24))
     print(f"Total unique days found: {total_unique_days}")
     
     # Count how many days have data for each hour (0-23)
-    hourly_counts = master_df.groupby('Temp_Hour')['Temp_Date'].nunique()
+    hourly_counts = np.bincount(slots % 24, minlength=24)
     
     # Identify hours that appear less often than the total number of days
-    missing_hours = hourly_counts[hourly_counts < total_unique_days]
+    missing_hours = np.flatnonzero(hourly_counts < total_unique_days)
     
-    if not missing_hours.empty:
+    if len(missing_hours) > 0:
         print(f"\n[WARNING] The following hours are missing from some days:")
-        for hour, count in missing_hours.items():
+        for hour in missing_hours:
+            count = hourly_counts[hour]
             missing_count = total_unique_days - count
-            # --- THE FIX IS BELOW: int(hour) ---
-            print(f"  - {int(hour):02d}:00 is present on {count} days (Missing on {missing_count} days)")
+            print(f"  - {hour:02d}:00 is present on {count} days (Missing on {missing_count} days)")
     else:
         print("\n[PERFECT] Every hour (00:00 to 23:00) is present for every day collected!")
 
-    # Cleanup temp columns
-    master_df.drop(columns=['Temp_Hour', 'Temp_Date'], inplace=True)
     print("="*40)
 
 else:
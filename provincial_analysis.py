@@ -1,29 +1,39 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from er_dataset import read_master
 
 
-# 1. LOAD
-#df = pd.read_csv('Quebec_ER_Master_Dataset.csv')
-df = pd.read_csv('Quebec_ER_Master_Dataset.csv')
+def bincount_mean(codes, values, n_groups):
+    # Mean of values per integer group code (0..n_groups-1) in a single pass.
+    # Like groupby().mean(), missing values and codes < 0 are left out.
+    values = np.asarray(values, dtype='float64')
+    valid = (codes >= 0) & ~np.isnan(values)
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=n_groups)
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    with np.errstate(invalid='ignore'):
+        return sums / counts
 
-# 2. CLEANING
-# Remove the "Total régional" rows to avoid double counting
-df = df[df['Nom_etablissement'] != 'Total régional']
 
-# Convert columns to numeric (just in case they loaded as text)
-cols_to_fix = ['Nombre_de_civieres_occupees', 'Nombre_de_civieres_fonctionnelles', 'DMS_ambulatoire']
-for col in cols_to_fix:
-    df[col] = pd.to_numeric(df[col], errors='coerce')
+# 1. LOAD
+#df = pd.read_csv('Quebec_ER_Master_Dataset.csv')
+# (the "Total régional" rows are dropped while reading to avoid double counting)
+df = read_master('Quebec_ER_Master_Dataset.csv', drop_regional_totals=True)
 
-# 3. FEATURE ENGINEERING (Create the KPIs)
+# 2. FEATURE ENGINEERING (Create the KPIs)
 # Avoid division by zero
 df = df[df['Nombre_de_civieres_fonctionnelles'] > 0] 
 df['Occupancy_Rate'] = (df['Nombre_de_civieres_occupees'] / df['Nombre_de_civieres_fonctionnelles']) * 100
 
 # --- ANALYSIS A: REGIONAL DISPARITIES ---
 # Group by Region and calculate the mean Occupancy and Wait Time
-regional_stats = df.groupby('Region')[['Occupancy_Rate', 'DMS_ambulatoire']].mean().sort_values('Occupancy_Rate', ascending=False)
+# (regions are coded once, then each mean is two bincounts)
+region_codes, regions = pd.factorize(df['Region'], sort=True)
+regional_stats = pd.DataFrame(
+    {col: bincount_mean(region_codes, df[col], len(regions)) for col in ['Occupancy_Rate', 'DMS_ambulatoire']},
+    index=pd.Index(regions, name='Region'),
+).sort_values('Occupancy_Rate', ascending=False)
 
 print("Top 5 Most Overcrowded Regions:")
 print(regional_stats.head())
@@ -42,11 +52,13 @@ plt.show()
 # --- ANALYSIS B: THE PULSE (TIME SERIES) ---
 # We need to see the "average" day. 
 # We extract the "Hour" from the timestamp to see the daily cycle.
-df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-df['Hour'] = df['Timestamp'].dt.hour
+hours = df['Timestamp'].to_numpy(dtype='datetime64[h]')
+df['Hour'] = np.where(np.isnat(hours), -1, hours.astype(np.int64) % 24)
 
 # Group by Hour to see the "Average Day" pattern across the whole province
-hourly_pulse = df.groupby('Hour')['Occupancy_Rate'].mean()
+# (24 fixed bins, so a bincount does it without a groupby)
+hourly_pulse = pd.Series(bincount_mean(df['Hour'].to_numpy(), df['Occupancy_Rate'], 24), index=pd.RangeIndex(24, name='Hour'), name='Occupancy_Rate')
+hourly_pulse = hourly_pulse.dropna()
 
 plt.figure(figsize=(10, 5))
 sns.lineplot(x=hourly_pulse.index, y=hourly_pulse.values, linewidth=3, color='darkblue')
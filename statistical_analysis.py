@@ -2,28 +2,20 @@ import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 import numpy as np
+from er_dataset import read_master
 
 # 1. SETUP
-# Load your master dataset
-df = pd.read_csv('Quebec_ER_Master_Dataset.csv')
+# Load your master dataset (regional totals are filtered out while reading)
+df = read_master('Quebec_ER_Master_Dataset.csv', drop_regional_totals=True)
 
-# Filter out regional totals
-df = df[df['Nom_etablissement'] != 'Total régional']
+# 2. CLEANING
+# read_master already loads these columns as numbers (text like "pas d'information disponible" becomes NaN)
+required_cols = ['Nombre_de_civieres_fonctionnelles', 'Nombre_de_civieres_occupees', 'DMS_ambulatoire']
 
-# --- THE FIX IS HERE ---
-# 2. CLEANING DATA TYPES
-# We force these columns to be numbers. 'coerce' turns bad data (like text) into NaN (empty)
-cols_to_fix = ['Nombre_de_civieres_fonctionnelles', 'Nombre_de_civieres_occupees', 'DMS_ambulatoire']
+# Drop rows where critical data is missing (NaN)
+df = df.dropna(subset=required_cols)
 
-for col in cols_to_fix:
-    # This line fixes the "TypeError" you saw
-    df[col] = pd.to_numeric(df[col], errors='coerce')
-
-# Drop rows where critical data is missing (NaN) after conversion
-df = df.dropna(subset=cols_to_fix)
-# -----------------------
-
-# Now this line will work because the column is numbers
+# Keep only rows with at least one working stretcher
 df = df[df['Nombre_de_civieres_fonctionnelles'] > 0] 
 
 # 3. CREATE VARIABLES
@@ -36,19 +28,29 @@ target_variable = 'DMS_ambulatoire'
 # 4. STATISTICAL BINNING (The "Threshold" Analysis)
 bins = [0, 60, 80, 100, 120, 150, 500]
 labels = ['<60%', '60-80%', '80-100%', '100-120%', '120-150%', '>150%']
-df['Occupancy_Bin'] = pd.cut(df['Occupancy_Rate'], bins=bins, labels=labels)
+# Same right-closed bins as pd.cut (e.g. exactly 60% is '<60%'), found with
+# one searchsorted call; values outside (0, 500] get code -1, i.e. NaN
+codes = np.searchsorted(bins, df['Occupancy_Rate'].to_numpy(), side='left') - 1
+codes[codes >= len(labels)] = -1
+df['Occupancy_Bin'] = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
 
 # 5. VISUALIZATION 1: The "Hockey Stick" Scatter Plot
+# Every row is binned into a fixed hexagon grid (log-scaled counts) instead
+# of being drawn as its own dot, so the draw cost no longer grows with the data
+y_max = df[target_variable].quantile(0.99)
 plt.figure(figsize=(12, 6))
-sns.scatterplot(data=df, x='Occupancy_Rate', y=target_variable, alpha=0.1, color='gray', s=10)
+plt.hexbin(df['Occupancy_Rate'], df[target_variable], gridsize=(200, 100), extent=(0, 200, 0, y_max), cmap='Greys', bins='log', mincnt=1)
 
 # Add a "Trend Line" using a rolling median
-df_sorted = df.sort_values('Occupancy_Rate')
-rolling_median = df_sorted[target_variable].rolling(window=500, center=True).median()
-plt.plot(df_sorted['Occupancy_Rate'], rolling_median, color='red', linewidth=3, label='Median Trend Line')
+# Only the two plotted columns are put in occupancy order, not the whole frame
+order = np.argsort(df['Occupancy_Rate'].to_numpy())
+sorted_occupancy = df['Occupancy_Rate'].to_numpy()[order]
+sorted_target = pd.Series(df[target_variable].to_numpy()[order])
+rolling_median = sorted_target.rolling(window=500, center=True).median()
+plt.plot(sorted_occupancy, rolling_median, color='red', linewidth=3, label='Median Trend Line')
 
 plt.xlim(0, 200) 
-plt.ylim(0, df[target_variable].quantile(0.99)) 
+plt.ylim(0, y_max) 
 plt.title(f'The Tipping Point: Occupancy vs. {target_variable}')
 plt.xlabel('Occupancy Rate (%)')
 plt.ylabel('Average Wait Time (Hours)')
@@ -1,9 +1,13 @@
-import pandas as pd
 import numpy as np
-import random
-import matplotlib.pyplot as plt
-import seaborn as sns
+import heapq
+from collections import deque
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from multiprocessing import Pool
+# pandas (through er_dataset), matplotlib and seaborn are imported inside the
+# functions that use them, so the simulation itself starts without them.
+# sortedcontainers (third-party, `pip install sortedcontainers`) is needed
+# only by the CONGESTION_TRIGGER policy and is imported the same lazy way.
 
 # ==========================================
 # 1. CONFIGURATION (Based on your Real Data)
@@ -13,83 +17,47 @@ CONFIG = {
     'SHORT_THRESHOLD': 14.0,    # Reconstructed <33% threshold
     'LONG_THRESHOLD': 32.0,     # Reconstructed >66% threshold
     'CONGESTION_PENALTY': 0.1,  # 10% slowdown when over capacity
-    'RANDOM_SEED': 42           # Ensures Policy A vs B are identical comparisons
+    'CONGESTION_QUEUE_LIMIT': 10, # Queue length that triggers Triage (Policy D)
+    'RANDOM_SEED': 42,          # Ensures Policy A vs B are identical comparisons
+    
+    # We simulate 1 week (168 hours)
+    # Using a fixed "Crisis" arrival pattern (e.g., 2 patients/hour)
+    # In a full version, this comes from DataLoader
+    'SIM_DURATION': 168,
+    'ARRIVAL_RATE_PER_HOUR': 2, # Tuned to saturate a 33-bed hospital with 30h stays
+    'WARM_UP_PATIENTS': 35
 }
 
 # ==========================================
 # 2. THE PATIENT (The Data Object)
 # ==========================================
-@dataclass
+# The engine stores each patient attribute as its own array indexed by
+# patient id (see EREngine). Patient is only a readable view of one row.
+STATUSES = ["WAITING", "IN_BED", "DISCHARGED"]
+WAITING, IN_BED, DISCHARGED = range(len(STATUSES))
+SERVICE_CLASSES = ["SHORT", "STANDARD", "LONG"]
+PRIORITY_WEIGHTS = np.array([3, 2, 1], dtype=np.int8) # Low, Medium, High Priority
+
+def classify_services(durations):
+    # ASSIGN SERVICE CLASS (The "Triage-Lite" Proxy) for every patient at once
+    # SHORT below SHORT_THRESHOLD, LONG above LONG_THRESHOLD, else STANDARD
+    # (exactly LONG_THRESHOLD is still STANDARD, hence the nextafter edge)
+    edges = [CONFIG['SHORT_THRESHOLD'], np.nextafter(CONFIG['LONG_THRESHOLD'], np.inf)]
+    return np.digitize(durations, edges).astype(np.int8)
+
+@dataclass(slots=True) # No per-instance __dict__
 class Patient:
     id: int
     arrival_time: float      # Hour of arrival (e.g., 14.5)
     service_duration_raw: float  # Assigned at birth based on probability
-    
-    def __post_init__(self):
-        self.wait_time = 0.0
-        self.completion_time = None
-        self.status = "WAITING"  # WAITING, IN_BED, DISCHARGED
-        
-        # ASSIGN SERVICE CLASS (The "Triage-Lite" Proxy)
-        if self.service_duration_raw < CONFIG['SHORT_THRESHOLD']:
-            self.service_class = "SHORT"
-            self.priority_weight = 3 # Low Priority
-        elif self.service_duration_raw > CONFIG['LONG_THRESHOLD']:
-            self.service_class = "LONG"
-            self.priority_weight = 1 # High Priority
-        else:
-            self.service_class = "STANDARD"
-            self.priority_weight = 2 # Medium Priority
-
-# ==========================================
-# 3. THE POLICY MANAGER (The Brain)
-# ==========================================
-class PolicyManager:
-    def __init__(self, mode="BASELINE"):
-        self.mode = mode
-
-    def sort_queue(self, queue, current_time):
-        """
-        Re-orders the waiting list based on the active policy.
-        """
-        # Helper function to generate sort keys
-        def get_sort_key(p):
-            
-            # --- POLICY A: BASELINE (Triage-Lite) ---
-            # Mimics real Quebec prioritization (Sicker/Longer = First)
-            if self.mode == "BASELINE":
-                return (p.priority_weight, p.arrival_time)
-            
-            # --- POLICY B: NULL HYPOTHESIS (FCFS) ---
-            # Pure First-Come-First-Served
-            elif self.mode == "FCFS":
-                return (0, p.arrival_time)
-            
-            # --- POLICY C: GUILLOTINE (>24h Priority) ---
-            # If waiting > 24h, super-priority. Else Baseline.
-            elif self.mode == "GUILLOTINE":
-                is_crisis = (current_time - p.arrival_time) > 24
-                # (0 = Crisis, 1 = Normal)
-                priority = 0 if is_crisis else 1
-                return (priority, p.priority_weight, p.arrival_time)
-                
-            # --- POLICY D: CONGESTION TRIGGER ---
-            # If queue is long (>10 people), use Triage. Else use FCFS.
-            elif self.mode == "CONGESTION_TRIGGER":
-                is_congested = len(queue) > 10
-                if is_congested:
-                    return (p.priority_weight, p.arrival_time)
-                else:
-                    return (0, p.arrival_time)
-            
-            return (0, p.arrival_time)
-
-        # Apply the sort
-        queue.sort(key=get_sort_key)
-        return queue
+    service_class: str       # SHORT, STANDARD, LONG
+    priority_weight: int     # 1 = High, 2 = Medium, 3 = Low Priority
+    wait_time: float
+    status: str              # WAITING, IN_BED, DISCHARGED
+    completion_time: float | None   # None until discharged
 
 # ==========================================
-# 4. DATA LOADER (The Reality Connector)
+# 3. DATA LOADER (The Reality Connector)
 # ==========================================
 class DataLoader:
     def __init__(self, file_path):
@@ -97,12 +65,15 @@ class DataLoader:
         self.arrivals_schedule = {} # {Hour: Count}
 
     def load_royal_vic_data(self):
+        from er_dataset import read_master
+        
         print("Loading and filtering Real Data...")
-        df = pd.read_csv(self.file_path)
+        df = read_master(self.file_path)
         
-        # Filter for Royal Victoria
-        vic = df[df['Nom_installation'].str.contains("ROYAL VICTORIA", case=False, na=False)].copy()
-        vic['Timestamp'] = pd.to_datetime(vic['Mise_a_jour'])
+        # Filter for Royal Victoria (match the distinct names, then select by category)
+        names = df['Nom_installation'].cat.categories
+        vic_names = names[names.str.contains("ROYAL VICTORIA", case=False)]
+        vic = df[df['Nom_installation'].isin(vic_names)].copy()
         vic = vic.sort_values('Timestamp')
         
         # Calculate Arrivals (Reverse engineering from Occupancy)
@@ -114,134 +85,332 @@ class DataLoader:
         return vic
 
 # ==========================================
-# 5. THE SIMULATION ENGINE (The World)
+# 4. THE SIMULATION ENGINE (The World)
 # ==========================================
-class EREngine:
-    def __init__(self, policy_name="BASELINE"):
+def heappop_k(heap, k):
+    # Takes the k smallest entries off the heap in one go (fewer if it runs out)
+    return [heapq.heappop(heap) for _ in range(min(k, len(heap)))]
+
+def advance_hour(wait_time, status, waiting, bed_remaining, capacity, penalty):
+    """
+    Moves every patient one hour forward with in-place array operations.
+    Returns a mask over bed_remaining of the patients whose care is finished.
+    """
+    # Everyone still in the queue waited one more hour
+    # (waiting is a preallocated scratch mask the same length as status)
+    np.equal(status, WAITING, out=waiting)
+    np.add(wait_time, 1.0, out=wait_time, where=waiting)
+
+    # Everyone in a bed got one more hour of care
+    # Soft Limit Logic: If congested, service is slower (penalty is taken
+    # off the hour of care, the same for every bed, so it is one subtraction)
+    is_congested = len(bed_remaining) > capacity
+    decrement = 1.0 - penalty if is_congested else 1.0
+    np.subtract(bed_remaining, decrement, out=bed_remaining)
+
+    return bed_remaining <= 0
+
+class EREngine(ABC):
+    """
+    The world every policy shares: patients, beds and the hourly clock.
+    Each policy below is a subclass that owns the waiting queue through
+    three methods: push(p_id), rerank() once an hour, and pop(n_beds).
+    """
+    policy_name = None
+    
+    def __init__(self, durations):
         self.env_time = 0
-        self.queue = []
-        self.beds = [] # List of active patients in beds
-        self.completed_patients = []
-        self.policy_manager = PolicyManager(policy_name)
-        self.policy_name = policy_name
+        self.n_patients = 0 # Patients spawned so far (also the next patient id)
+        
+        # THE PATIENT TABLE: one array per attribute, indexed by patient id.
+        # It has a row for every pre-drawn service time, so it never grows.
+        n_rows = len(durations)
+        self.service_duration = np.asarray(durations, dtype=np.float64)
+        self.service_class = classify_services(self.service_duration)
+        self.priority_weight = PRIORITY_WEIGHTS[self.service_class]
+        self.arrival_time = np.zeros(n_rows)
+        self.wait_time = np.zeros(n_rows)
+        self.status = np.full(n_rows, WAITING, dtype=np.int8)
+        self.completion_time = np.full(n_rows, np.nan)
+        self.waiting = np.empty(n_rows, dtype=bool) # Scratch mask for advance_hour
+        
+        # THE BEDS: bed_ids[:n_beds] are the patients in beds and
+        # bed_remaining[:n_beds] their remaining hours of care, side by side.
+        # The buffers can hold every patient, so beds are filled and emptied
+        # in place and nothing is reallocated during the run.
+        self.bed_ids = np.empty(n_rows, dtype=np.int64)
+        self.bed_remaining = np.empty(n_rows)
+        self.n_beds = 0
         
         # Statistics
         self.history_wait_times = []
         
-    def spawn_patient(self, p_id):
-        # 1. Determine Duration (LogNormal Reconstruction)
-        # We draw from a distribution centered on the Real Mean (30h)
-        # Sigma=0.8 provides the "Heavy Tail"
-        duration = random.lognormvariate(mu=np.log(30), sigma=0.8)
+    def patient(self, p_id):
+        # Readable snapshot of one patient's row (not used by the simulation)
+        completion_time = self.completion_time[p_id]
+        return Patient(
+            id=p_id,
+            arrival_time=float(self.arrival_time[p_id]),
+            service_duration_raw=float(self.service_duration[p_id]),
+            service_class=SERVICE_CLASSES[self.service_class[p_id]],
+            priority_weight=int(self.priority_weight[p_id]),
+            wait_time=float(self.wait_time[p_id]),
+            status=STATUSES[self.status[p_id]],
+            completion_time=None if np.isnan(completion_time) else float(completion_time),
+        )
+        
+    def spawn_patient(self):
+        # Patients are numbered in spawn order, which is also the order of
+        # their pre-drawn service times and the tie-breaker between equal keys
+        p_id = self.n_patients
+        self.n_patients += 1
         
-        # 2. Create Patient
-        p = Patient(p_id, self.env_time, duration)
-        self.queue.append(p)
+        self.arrival_time[p_id] = self.env_time
+        self.push(p_id)
+        
+    def warm_up(self, n_patients):
+        # Pre-Warm (Hot Start): the next n_patients arrive now and go straight
+        # into beds without waiting (even past capacity), all in one go
+        ids = np.arange(self.n_patients, self.n_patients + n_patients)
+        self.n_patients += n_patients
+        self.arrival_time[ids] = self.env_time
+        self.status[ids] = IN_BED
+        
+        start = self.n_beds
+        self.n_beds += n_patients
+        self.bed_ids[start:self.n_beds] = ids
+        self.bed_remaining[start:self.n_beds] = self.service_duration[ids]
+        
+    def admit(self, n_beds):
+        # Moves up to n_beds patients from the front of the queue into beds
+        admitted = self.pop(n_beds)
+        start = self.n_beds
+        self.n_beds += len(admitted)
+        self.bed_ids[start:self.n_beds] = admitted
+        self.bed_remaining[start:self.n_beds] = self.service_duration[admitted]
+        self.status[admitted] = IN_BED
         
     def step(self, hour_index, new_arrivals_count):
         self.env_time = hour_index
         
         # 1. NEW ARRIVALS
         for _ in range(new_arrivals_count):
-            p_id = len(self.completed_patients) + len(self.beds) + len(self.queue)
-            self.spawn_patient(p_id)
-            
-        # 2. UPDATE WAIT TIMES
-        for p in self.queue:
-            p.wait_time += 1.0 # Add 1 hour
-            
-        # 3. PROCESS DISCHARGES
-        # We assume 1 step = 1 hour
-        remaining_beds = []
-        for p in self.beds:
-            p.service_duration_raw -= 1.0
+            self.spawn_patient()
             
-            # Soft Limit Logic: If congested, service is slower
-            if len(self.beds) > CONFIG['CAPACITY_BEDS']:
-                p.service_duration_raw += CONFIG['CONGESTION_PENALTY'] # Add penalty
-            
-            if p.service_duration_raw <= 0:
-                p.status = "DISCHARGED"
-                p.completion_time = self.env_time
-                self.completed_patients.append(p)
-            else:
-                remaining_beds.append(p)
-        self.beds = remaining_beds
+        # 2. UPDATE WAIT TIMES & 3. PROCESS DISCHARGES
+        # We assume 1 step = 1 hour (only rows of spawned patients take part)
+        n = self.n_patients
+        beds = self.bed_ids[:self.n_beds]
+        remaining = self.bed_remaining[:self.n_beds]
+        done = advance_hour(self.wait_time[:n], self.status[:n], self.waiting[:n], remaining,
+                            CONFIG['CAPACITY_BEDS'], CONFIG['CONGESTION_PENALTY'])
+        discharged = beds[done]
+        self.status[discharged] = DISCHARGED
+        self.completion_time[discharged] = self.env_time
+        
+        # Close the gaps left by discharged patients inside the same buffers
+        staying = ~done
+        self.n_beds = np.count_nonzero(staying)
+        self.bed_ids[:self.n_beds] = beds[staying]
+        self.bed_remaining[:self.n_beds] = remaining[staying]
         
         # 4. ADMIT NEW PATIENTS
-        # Sort queue based on Policy
-        self.policy_manager.sort_queue(self.queue, self.env_time)
+        # Let the Policy re-rank the queue if its order changes over time
+        self.rerank()
         
         # Fill empty beds (Soft Cap: We allow slight overflow to simulate hallway)
-        while len(self.beds) < CONFIG['CAPACITY_BEDS'] and self.queue:
-            next_patient = self.queue.pop(0)
-            next_patient.status = "IN_BED"
-            self.beds.append(next_patient)
+        self.admit(CONFIG['CAPACITY_BEDS'] - self.n_beds)
+
+    # --- QUEUE (provided by each policy) ---
+    @abstractmethod
+    def push(self, p_id):
+        pass
+        
+    @abstractmethod
+    def rerank(self):
+        pass
+        
+    @abstractmethod
+    def pop(self, n_beds):
+        # Takes up to n_beds patient ids off the front of the queue
+        pass
+
+# ==========================================
+# 5. THE POLICIES (The Brain)
+# ==========================================
+# One engine per policy, each with its ranking rule and the cheapest queue
+# that keeps that order, so the hourly loop never checks which policy runs.
+
+# --- POLICY A: BASELINE (Triage-Lite) ---
+# Mimics real Quebec prioritization (Sicker/Longer = First)
+class BaselineEngine(EREngine):
+    policy_name = "BASELINE"
+    
+    def __init__(self, durations):
+        super().__init__(durations)
+        self.queue = [] # Heap of (sort key, patient id)
+        
+    def sort_key(self, p_id):
+        return (self.priority_weight[p_id], self.arrival_time[p_id])
+        
+    def push(self, p_id):
+        heapq.heappush(self.queue, (self.sort_key(p_id), p_id))
+        
+    def rerank(self):
+        # Keys are fixed at arrival, so the heap is always in order
+        pass
+        
+    def pop(self, n_beds):
+        return [p_id for _, p_id in heappop_k(self.queue, n_beds)]
+
+# --- POLICY B: NULL HYPOTHESIS (FCFS) ---
+# Pure First-Come-First-Served
+class FCFSEngine(EREngine):
+    policy_name = "FCFS"
+    
+    def __init__(self, durations):
+        super().__init__(durations)
+        # Patient ids are handed out in arrival order, so a plain line is
+        # already in FCFS order: no keys and no heap
+        self.queue = deque()
+        
+    def push(self, p_id):
+        self.queue.append(p_id)
+        
+    def rerank(self):
+        pass
+        
+    def pop(self, n_beds):
+        return [self.queue.popleft() for _ in range(min(n_beds, len(self.queue)))]
+
+# --- POLICY C: GUILLOTINE (>24h Priority) ---
+# If waiting > 24h, super-priority. Else Baseline.
+class GuillotineEngine(BaselineEngine):
+    policy_name = "GUILLOTINE"
+    
+    def sort_key(self, p_id):
+        is_crisis = (self.env_time - self.arrival_time[p_id]) > 24
+        # (0 = Crisis, 1 = Normal)
+        priority = 0 if is_crisis else 1
+        return (priority, self.priority_weight[p_id], self.arrival_time[p_id])
+        
+    def rerank(self):
+        # Crisis status changes with the clock: re-key everyone, then heapify
+        self.queue = [(self.sort_key(p_id), p_id) for _, p_id in self.queue]
+        heapq.heapify(self.queue)
+
+def sorted_queue(p_ids, key):
+    # The single import point for sortedcontainers (Policy D only)
+    from sortedcontainers import SortedKeyList
+    return SortedKeyList(p_ids, key=key)
+
+# --- POLICY D: CONGESTION TRIGGER ---
+# If queue is long (>10 people), use Triage. Else use FCFS.
+class CongestionTriggerEngine(EREngine):
+    policy_name = "CONGESTION_TRIGGER"
+    
+    def __init__(self, durations):
+        super().__init__(durations)
+        # Only two fixed orders are ever used, so the queue is kept sorted
+        # and only re-sorted when the congestion state flips
+        self.is_congested = False
+        self.queue = sorted_queue([], self.sort_key)
+        
+    def sort_key(self, p_id):
+        if self.is_congested:
+            return (self.priority_weight[p_id], self.arrival_time[p_id], p_id)
+        else:
+            return (0, self.arrival_time[p_id], p_id)
+        
+    def push(self, p_id):
+        self.queue.add(p_id)
+        
+    def rerank(self):
+        is_congested = len(self.queue) > CONFIG['CONGESTION_QUEUE_LIMIT']
+        if is_congested != self.is_congested:
+            self.is_congested = is_congested
+            self.queue = sorted_queue(self.queue, self.sort_key)
+        
+    def pop(self, n_beds):
+        n_admitted = max(0, min(n_beds, len(self.queue)))
+        admitted = list(self.queue.islice(0, n_admitted))
+        del self.queue[:n_admitted]
+        return admitted
+
+ENGINES = {engine.policy_name: engine for engine in (BaselineEngine, FCFSEngine, GuillotineEngine, CongestionTriggerEngine)}
 
 # ==========================================
 # 6. RUNNER & VISUALIZATION
 # ==========================================
-def run_comparison():
-    # Setup - Deterministic Seeds for Fairness
-    policies = ["FCFS", "BASELINE", "GUILLOTINE"]
-    results = {}
+def run_one(pol):
+    # One full simulation for one policy. Runs in its own worker process,
+    # with its own generator from the same seed -> Identical Patients.
+    print(f"Running Simulation for Policy: {pol}...")
+    rng = np.random.default_rng(CONFIG['RANDOM_SEED'])
     
-    # We simulate 1 week (168 hours)
-    # Using a fixed "Crisis" arrival pattern (e.g., 2 patients/hour)
-    # In a full version, this comes from DataLoader
-    SIM_DURATION = 168 
-    ARRIVAL_RATE_PER_HOUR = 2 # Tuned to saturate a 33-bed hospital with 30h stays
+    # Draw every random number up front in two numpy calls
+    # Poisson Arrival Process: patients arriving in each hour
+    arrivals = rng.poisson(CONFIG['ARRIVAL_RATE_PER_HOUR'], size=CONFIG['SIM_DURATION'])
+    # Service times (LogNormal Reconstruction), one per patient incl. warm-up
+    # Centered on the Real Mean (30h), Sigma=0.8 provides the "Heavy Tail"
+    durations = rng.lognormal(mean=np.log(30), sigma=0.8, size=CONFIG['WARM_UP_PATIENTS'] + arrivals.sum())
     
-    for pol in policies:
-        print(f"Running Simulation for Policy: {pol}...")
-        random.seed(CONFIG['RANDOM_SEED']) # RESET SEED -> Identical Patients
-        np.random.seed(CONFIG['RANDOM_SEED'])
+    sim = ENGINES[pol](durations)
+    
+    # Pre-Warm (Hot Start) - Fill the beds first
+    sim.warm_up(CONFIG['WARM_UP_PATIENTS'])
         
-        sim = EREngine(policy_name=pol)
+    # Run Loop
+    for t in range(CONFIG['SIM_DURATION']):
+        sim.step(t, int(arrivals[t]))
         
-        # Pre-Warm (Hot Start) - Fill the beds first
-        for _ in range(35): 
-            sim.spawn_patient(999)
-            if len(sim.queue) > 0: sim.beds.append(sim.queue.pop(0))
-            
-        # Run Loop
-        for t in range(SIM_DURATION):
-            # Poisson Arrival Process
-            n_arrivals = np.random.poisson(ARRIVAL_RATE_PER_HOUR)
-            sim.step(t, n_arrivals)
-            
-        # Collect Data
-        # We only look at patients who finished or are waiting > 0
-        waits = [p.wait_time for p in sim.completed_patients + sim.beds]
-        results[pol] = waits
+    # Collect Data
+    # We only look at patients who got a bed (finished or still in one)
+    spawned = sim.n_patients
+    waits = sim.wait_time[:spawned][sim.status[:spawned] != WAITING]
+    return pol, waits
 
-    # --- PLOTTING ---
-    plt.figure(figsize=(14, 7))
+def plot_results(results, policies):
+    # Only called once every simulation has finished
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    fig, (ax_box, ax_tail) = plt.subplots(1, 2, figsize=(14, 7))
     
     # Plot 1: Box Plot of Wait Times
-    plt.subplot(1, 2, 1)
     data_to_plot = [results[p] for p in policies]
-    plt.boxplot(data_to_plot, labels=policies, showfliers=False)
-    plt.title("Distribution of Wait Times (Excluding outliers)")
-    plt.ylabel("Wait Time (Hours)")
+    ax_box.boxplot(data_to_plot, labels=policies, showfliers=False)
+    ax_box.set_title("Distribution of Wait Times (Excluding outliers)")
+    ax_box.set_ylabel("Wait Time (Hours)")
     
     # Plot 2: The Tail (The Guillotine Effect)
-    plt.subplot(1, 2, 2)
     for pol in policies:
-        # Calculate CDF of tail
+        # Sort once, then cut at the first wait above 10h
         sorted_waits = np.sort(results[pol])
-        tail_waits = sorted_waits[sorted_waits > 10] # Look at long waits only
+        tail_waits = sorted_waits[np.searchsorted(sorted_waits, 10, side='right'):] # Look at long waits only
         if len(tail_waits) > 0:
-            sns.kdeplot(tail_waits, label=pol, linewidth=2)
+            # Fixed bandwidth so every policy's curve is smoothed the same way
+            sns.kdeplot(tail_waits, label=pol, linewidth=2, bw_method=0.3, ax=ax_tail)
             
-    plt.axvline(24, color='red', linestyle='--', label="24h Limit")
-    plt.title("Tail Risk: Density of Extreme Waits (>10h)")
-    plt.xlabel("Wait Time (Hours)")
-    plt.legend()
+    ax_tail.axvline(24, color='red', linestyle='--', label="24h Limit")
+    ax_tail.set_title("Tail Risk: Density of Extreme Waits (>10h)")
+    ax_tail.set_xlabel("Wait Time (Hours)")
+    ax_tail.legend()
     
-    plt.tight_layout()
-    plt.savefig("Final_Policy_Comparison.png")
+    fig.tight_layout()
+    fig.savefig("Final_Policy_Comparison.png")
     print("\nSimulation Complete. Graph saved as 'Final_Policy_Comparison.png'")
+
+def run_comparison():
+    # Setup - Deterministic Seeds for Fairness
+    policies = ["FCFS", "BASELINE", "GUILLOTINE"]
+    
+    # The policies don't share any state, so run them side by side
+    with Pool(processes=len(policies)) as pool:
+        results = dict(pool.map(run_one, policies))
+
+    # --- PLOTTING ---
+    plot_results(results, policies)
     
     # Print Stats
     for pol in policies:
@@ -250,4 +419,4 @@ def run_comparison():
         print(f"Policy {pol:12} | Avg Wait: {np.mean(waits):.1f}h | Max Wait: {np.max(waits):.1f}h | Patients >24h: {extreme}")
 
 if __name__ == "__main__":
-    run_comparison()
\ No newline at end of file
+    run_comparison()